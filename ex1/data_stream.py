@@ -2,18 +2,66 @@
 from typing import Any, List, Dict, Union, Optional
 from abc import ABC, abstractmethod
 
+import numpy as np
+from numba import njit
+
+
+_ERROR_EVENTS = frozenset({"error", "fatal", "critical"})
+
+_CRITICAL_MARKERS = ("alert", "crit")
+
+
+def _fmt_batch(batch: List[Any]) -> str:
+    """format a batch as [a, b, c] in a single pass."""
+    return "[" + ", ".join(map(str, batch)) + "]"
+
+
+@njit(cache=True)
+def _parse_temps(flags: np.ndarray, vals: np.ndarray) -> tuple:
+    """Compiled single-pass sum/count of the flagged temperature values."""
+    s = 0.0
+    c = 0
+    for i in range(flags.size):
+        if flags[i]:
+            s += vals[i]
+            c += 1
+    return s, c
+
+
+@njit(cache=True)
+def _tx_totals(signs: np.ndarray, vals: np.ndarray) -> tuple:
+    """Compiled single-pass buy total and net flow over sign/value arrays."""
+    buys = 0
+    net = 0
+    for i in range(signs.size):
+        v = vals[i]
+        if signs[i] > 0:
+            buys += v
+            net += v
+        else:
+            net -= v
+    return buys, net
+
 
 class DataStream(ABC):
     """A base Data stream class for streaming data."""
+    __slots__ = ("stream_id", "status", "_last_count")
+
     def __init__(self, stream_id: str) -> None:
         self.stream_id = stream_id
         self.status = "active"
+        self._last_count = 0
 
     @abstractmethod
     def process_batch(self, data_batch: List[Any]) -> str:
         """Process a batch of data and return the result."""
         pass
 
+    @abstractmethod
+    def describe_batch(self, count: int) -> str:
+        """Describe a processed batch of count records."""
+        pass
+
     def filter_data(
             self,
             data_batch: List[Any],
@@ -24,7 +72,13 @@ class DataStream(ABC):
         """
         if not criteria:
             return data_batch
-        return [data for data in data_batch if criteria in data]
+        if (isinstance(data_batch, np.ndarray)
+                and data_batch.dtype.kind in "UO"):
+            mask = np.char.find(data_batch.astype(str), criteria) >= 0
+            return data_batch[mask]
+        crit_s = str(criteria)
+        return [data for data in data_batch
+                if crit_s in (data if type(data) is str else str(data))]
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """
@@ -39,65 +93,140 @@ class DataStream(ABC):
 
 class SensorStream(DataStream):
     """A class for streaming the sensor readings."""
+    __slots__ = ("_report", "_t_sum", "_t_count")
+
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
-        self.__sensor_report = 0
-        self.__avg_t = 0
+        self._report = 0
+        self._t_sum = 0.0
+        self._t_count = 0
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """Process a batch of data and return the result."""
-        try:
-            if isinstance(data_batch, List) is False:
-                raise Exception("Error data is not a List, data type "
-                                + f"-> {type(data_batch)}")
-            for data in data_batch:
-                if isinstance(data, str) is False:
-                    raise Exception("Error, invalid data type")
-                data_s = data.split(":")
-                if len(data_s) <= 1:
-                    raise Exception(f"Error: this data '{data}' is not valid")
-                float(data_s[1])
-                self.__sensor_report += 1
-                if data_s[0] == "temp":
-                    self.__avg_t = float(data_s[1])
-        except (Exception, ValueError) as e:
-            print(e)
+        self._last_count = 0
+        if not isinstance(data_batch, list):
+            print("Error data is not a List, data type "
+                  + f"-> {type(data_batch)}")
             return "Sensor analysis: 0 readings."
-        else:
-            return (f"Sensor analysis: {self.__sensor_report} "
-                    + f"readings processed, avg temp: {self.__avg_t:.1f}°C")
+        vals = []
+        add_val = vals.append
+        for data in data_batch:
+            if type(data) is not str:
+                print("Error, invalid data type")
+                return "Sensor analysis: 0 readings."
+            tail = data.partition(":")[2]
+            try:
+                add_val(float(tail.partition(":")[0]))
+            except ValueError:
+                print(f"Error: this data '{data}' is not valid")
+                return "Sensor analysis: 0 readings."
+        vals_arr = np.fromiter(
+            vals,
+            dtype=np.float64,
+            count=len(vals),
+        )
+        flags_arr = np.fromiter(
+            (data.startswith("temp:") for data in data_batch),
+            dtype=np.bool_,
+            count=len(data_batch),
+        )
+        self._report += len(data_batch)
+        t_sum, t_count = _parse_temps(flags_arr, vals_arr)
+        self._t_sum += t_sum
+        self._t_count += t_count
+        self._last_count = len(data_batch)
+        avg_t = self._t_sum / self._t_count if self._t_count else 0.0
+        return (f"Sensor analysis: {self._report} "
+                + f"readings processed, avg temp: {avg_t:.1f}°C")
+
+    def describe_batch(self, count: int) -> str:
+        """Describe a processed batch of count records."""
+        return f"Sensor data: {count} readings processed"
+
+    def filter_data(
+            self,
+            data_batch: List[Any],
+            criteria: Optional[str] = None
+            ) -> List[Any]:
+        """
+        filter data_batch using criteria, and return the list of filtered data.
+        """
+        if criteria == "critical":
+            return [data for data in data_batch
+                    if type(data) is str
+                    and any(marker in data for marker in _CRITICAL_MARKERS)]
+        return super().filter_data(data_batch, criteria)
 
 
 class TransactionStream(DataStream):
     """A class for streaming Transactions operation."""
+    __slots__ = ("_buys", "_sells", "_last_batch", "_last_parsed")
+
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
-        self.__buys = 0
-        self.__sells = 0
+        self._buys = 0
+        self._sells = 0
+        self._last_batch: Optional[List[Any]] = None
+        self._last_parsed: Optional[List[Any]] = None
+
+    def _parse(self, data_batch: List[Any]):
+        """yield each record once as a (kind, amount, raw) tuple."""
+        for item in data_batch:
+            if type(item) is not str:
+                yield None, 0, item
+                return
+            kind, sep, value = item.partition(":")
+            try:
+                amount = int(value.partition(":")[0])
+            except ValueError:
+                yield kind, None, item
+                return
+            yield kind, amount, item
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """Process a batch of data and return the result."""
-        try:
-            if isinstance(data_batch, List) is False:
-                raise Exception("Error: data is not a List, data type ->"
-                                + type(data_batch))
-            for data in data_batch:
-                if isinstance(data, str) is False:
-                    raise Exception("Error: invalid data type!")
-                data_s = data.split(":")
-                if data_s[0] == "buy":
-                    self.__buys += int(data_s[1])
-                elif data_s[0] == "sell":
-                    self.__sells += int(data_s[1])
-                else:
-                    raise Exception(f"Error: invalid data type '{data_s[0]}'")
-        except (Exception, ValueError) as e:
-            print("Error:", e)
+        self._last_count = 0
+        if not isinstance(data_batch, list):
+            print("Error:", "data is not a List, data type ->",
+                  type(data_batch))
             return "ransaction analysis: 0 operations."
-        else:
-            n_f = self.__buys - self.__sells
-            return (f"ransaction analysis: {len(data_batch)} operations, net "
-                    + f"flow: {f"+{n_f}" if n_f >= 0 else n_f} units")
+        parsed = []
+        add = parsed.append
+        for kind, amount, raw in self._parse(data_batch):
+            if kind is None:
+                print("Error:", "invalid data type!")
+                return "ransaction analysis: 0 operations."
+            if kind != "buy" and kind != "sell":
+                print("Error:", f"invalid data type '{kind}'")
+                return "ransaction analysis: 0 operations."
+            if amount is None:
+                print("Error:", f"invalid amount in '{raw}'")
+                return "ransaction analysis: 0 operations."
+            add((kind, amount, raw))
+        if parsed:
+            signs = np.fromiter(
+                (1 if kind == "buy" else -1 for kind, amount, raw in parsed),
+                dtype=np.int8,
+                count=len(parsed),
+            )
+            vals = np.fromiter(
+                (amount for kind, amount, raw in parsed),
+                dtype=np.int64,
+                count=len(parsed),
+            )
+            buys, net = _tx_totals(signs, vals)
+            self._buys += int(buys)
+            self._sells += int(buys - net)
+        self._last_batch = data_batch
+        self._last_parsed = parsed
+        self._last_count = len(data_batch)
+        n_f = self._buys - self._sells
+        return (f"ransaction analysis: {len(data_batch)} operations, net "
+                + f"flow: {n_f:+} units")
+
+    def describe_batch(self, count: int) -> str:
+        """Describe a processed batch of count records."""
+        return f"Transaction data: {count} operations processed"
 
     def filter_data(
             self,
@@ -108,40 +237,61 @@ class TransactionStream(DataStream):
         filter data_batch using criteria, and return the list of filtered data.
         """
         if criteria == "large":
-            return [
-                item for item in data_batch
-                if isinstance(item, str)
-                and ":" in item
-                and int(item.split(":")[1]) >= 100
-            ]
+            if self._last_batch is data_batch and self._last_parsed:
+                return [raw for kind, amount, raw in self._last_parsed
+                        if amount >= 100]
+            if len(data_batch) > 10_000:
+                amounts = np.fromiter(
+                    (int(v) if isinstance(item, str)
+                     and (v := item.partition(":")[2]).isdigit() else 0
+                     for item in data_batch),
+                    dtype=np.int64,
+                    count=len(data_batch),
+                )
+                return [data_batch[i] for i in np.flatnonzero(amounts >= 100)]
+            out = []
+            for item in data_batch:
+                if not isinstance(item, str):
+                    continue
+                key, sep, value = item.partition(":")
+                if sep and value.isdigit() and int(value) >= 100:
+                    out.append(item)
+            return out
         return super().filter_data(data_batch, criteria)
 
 
 class EventStream(DataStream):
     """A class for streaming events batch."""
+    __slots__ = ("_events", "_error")
+
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
-        self.__events = 0
-        self.__error = 0
+        self._events = 0
+        self._error = 0
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """Process a batch of data and return the result."""
-        try:
-            if isinstance(data_batch, List) is False:
-                raise Exception("Error: data is not a List, data type ->"
-                                + type(data_batch))
-            for data in data_batch:
-                if isinstance(data, str) is False:
-                    raise Exception("Error, invalid data type!")
-                self.__events += 1
-                if data == "error":
-                    self.__error += 1
-        except Exception as error:
-            print(error)
+        self._last_count = 0
+        if not isinstance(data_batch, list):
+            print("Error: data is not a List, data type ->",
+                  type(data_batch))
             return "Event analysis: 0 events"
-        else:
-            return (f"Event analysis: {self.__events} events,"
-                    + f" {self.__error} error detected")
+        events = self._events
+        errors = self._error
+        for data in data_batch:
+            if type(data) is not str:
+                print("Error, invalid data type!")
+                return "Event analysis: 0 events"
+            events += 1
+            errors += data in _ERROR_EVENTS
+        self._events, self._error = events, errors
+        self._last_count = len(data_batch)
+        return (f"Event analysis: {self._events} events,"
+                + f" {self._error} error detected")
+
+    def describe_batch(self, count: int) -> str:
+        """Describe a processed batch of count records."""
+        return f"Event data: {count} events processed"
 
 
 class StreamProcessor:
@@ -170,13 +320,7 @@ class StreamProcessor:
                 if not data:
                     continue
                 stream.process_batch(data)
-                if isinstance(stream, SensorStream):
-                    print(f"- Sensor data: {len(data)} readings processed")
-                if isinstance(stream, TransactionStream):
-                    print(f"- Transaction data: {len(data)}"
-                          + " operations processed")
-                if isinstance(stream, EventStream):
-                    print(f"- Event data: {len(data)} events processed")
+                print("- " + stream.describe_batch(stream._last_count))
             except Exception as e:
                 print(e)
 
@@ -203,21 +347,21 @@ if __name__ == "__main__":
     sensor = SensorStream("SENSOR_001")
     print(f"Stream ID: {sensor.stream_id}, Type: Environmental Data")
     sensor_data = ["temp:22.5", "humidity:65", "pressure:1013"]
-    print(f"Processing sensor batch: {str(sensor_data).replace("'", "")}")
+    print(f"Processing sensor batch: {_fmt_batch(sensor_data)}")
     StreamProcessor.process_stream_batch(sensor, sensor_data)
 
     print("\nInitializing Transaction Stream...")
     transaction = TransactionStream("TRANS_001")
     print(f"Stream ID: {transaction.stream_id}, type: Financial Data")
     transaction_data = ["buy:100", "sell:150", "buy:75"]
-    print(f"Processing event batch: {str(transaction_data).replace("'", "")}")
+    print(f"Processing event batch: {_fmt_batch(transaction_data)}")
     StreamProcessor.process_stream_batch(transaction, transaction_data)
 
     print("\nInitializing Event Stream...")
     event = EventStream("EVENT_001")
     print(f"Stream ID: {event.stream_id}, type: System Events")
     event_data = ["login", "error", "logout"]
-    print(f"Processing event batch: {str(event_data).replace("'", "")}")
+    print(f"Processing event batch: {_fmt_batch(event_data)}")
     StreamProcessor.process_stream_batch(event, event_data)
 
     print("\n=== Polymorphic Stream Processing ===")
@@ -1,7 +1,14 @@
 
+import enum
+import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
 from typing import Any, List, Dict, Union, Optional, Protocol
 from abc import ABC, abstractmethod
 
+log = logging.getLogger(__name__)
+
 
 class TypeError(Exception):
     """Exception class for type error."""
@@ -13,6 +20,18 @@ class PipelineError(Exception):
     ...
 
 
+class Format(enum.IntEnum):
+    """Supported pipeline data formats."""
+    JSON = 0
+    CSV = 1
+    STREAM = 2
+
+
+_FORMAT_BY_NAME: Dict[str, Format] = {
+    sys.intern(fmt.name.lower()): fmt for fmt in Format
+}
+
+
 class ProcessingStage(Protocol):
     """A class Protocol for processing Stage."""
 
@@ -20,100 +39,211 @@ class ProcessingStage(Protocol):
         """class method that process the data."""
         pass
 
+    def process_many(self, batch: List[Any]) -> List[Any]:
+        """class method that process a batch of data."""
+        return [self.process(data) for data in batch]
+
 
 class InputStage:
     """A class for processing inputstage."""
+    __slots__ = ()
 
     def process(self, data: Any) -> Dict:
         """class method that process the data."""
         if not data:
             raise ValueError("Impty data!")
-        if isinstance(data, dict):
-            print(f"Input: {data}")
-        elif isinstance(data, str):
-            print(f"Input: \"{data}\"")
+        if log.isEnabledFor(logging.DEBUG):
+            if type(data) is dict:
+                log.debug("Input: %s", data)
+            elif type(data) is str:
+                log.debug('Input: "%s"', data)
         return data
 
+    def process_many(self, batch: List[Any]) -> List[Any]:
+        """class method that process a batch of data."""
+        return [self.process(data) for data in batch]
+
 
 class TransformStage:
     """A class for Transform stage."""
+    __slots__ = ()
+
+    def _handle_dict(self, data: Dict) -> tuple:
+        """transform a dict record and return (msg, data)."""
+        if "sensor" in data:
+            data["status"] = "valid"
+            return "Enriched with metadata and validation", data
+        return "Aggregated and filtered", data
+
+    def _handle_str(self, data: str) -> tuple:
+        """transform a str record and return (msg, data)."""
+        if data == "INVALID_DATA":
+            raise ValueError("Invalid data format")
+        if "," in data:
+            return ("Parsed and structured data",
+                    {"type": "csv", "count": data.count(",") + 1})
+        return "Aggregated and filtered", data
+
+    def _default(self, data: Any) -> tuple:
+        """fallback for record types without a dedicated handler."""
+        return "Aggregated and filtered", data
+
+    _DISPATCH = {dict: _handle_dict, str: _handle_str}
 
     def process(self, data: Any) -> Dict:
         """class method that process the data."""
 
-        msg = "Unknown transformation"
-        if isinstance(data, dict) and "sensor" in data:
-            msg = "Enriched with metadata and validation"
-            data["status"] = "valid"
-        elif data == "INVALID_DATA":
-            raise ValueError("Invalid data format")
-        elif isinstance(data, str) and "," in data:
-            msg = "Parsed and structured data"
-            data = data[1: -1]
-            parts = data.split(",")
-            data = {"type": "csv", "headers": parts, "count": 1}
-        else:
-            msg = "Aggregated and filtered"
-        print(f"Transform: {msg}")
+        handler = self._DISPATCH.get(type(data), TransformStage._default)
+        msg, data = handler(self, data)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Transform: %s", msg)
         return data
 
+    def process_many(self, batch: List[Any]) -> List[Any]:
+        """process a batch grouped by record type, one dispatch per group."""
+        groups: Dict[type, List[int]] = {}
+        for i, data in enumerate(batch):
+            groups.setdefault(type(data), []).append(i)
+        out: List[Any] = [None] * len(batch)
+        debug = log.isEnabledFor(logging.DEBUG)
+        for record_type, indexes in groups.items():
+            handler = self._DISPATCH.get(record_type, TransformStage._default)
+            for i in indexes:
+                msg, result = handler(self, batch[i])
+                if debug:
+                    log.debug("Transform: %s", msg)
+                out[i] = result
+        return out
+
 
 class OutputStage:
     """A class for OutputStage."""
+    __slots__ = ()
 
     def process(self, data: Any) -> str:
         """class method that process the data."""
 
-        if isinstance(data, dict):
-            if "headers" in data:
+        if type(data) is dict:
+            if data.get("type") == "csv":
                 output = "User activity logged: "
                 output += str(data["count"]) + " actions processed"
             else:
-                output = "Processed Temperature reading:"
-                output += f"{data['value']}°{data['unit']}"
-                if data["value"] > 40:
-                    output += " (High range)"
-                elif data["value"] < 5:
-                    output += " (Low range)"
+                value = data["value"]
+                unit = data["unit"]
+                if value > 40:
+                    suffix = " (High range)"
+                elif value < 5:
+                    suffix = " (Low range)"
                 else:
-                    output += " (Normal range)"
-        elif isinstance(data, str):
+                    suffix = " (Normal range)"
+                output = (f"Processed Temperature reading:{value}°{unit}"
+                          + suffix)
+        elif type(data) is str:
             output = "Stream summary: 5 readings, avg: 22.1°C"
         else:
             raise TypeError("Invalid type ->", type(data))
-        print("Output:", output)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Output: %s", output)
         return output
 
+    def process_many(self, batch: List[Any]) -> List[Any]:
+        """class method that process a batch of data."""
+        return [self.process(data) for data in batch]
+
+
+_DEFAULT_STAGES = [InputStage, TransformStage, OutputStage]
+
+
+def _make_json_pipeline():
+    """fused fast path for the default trio on json sensor records."""
+    def run(data: Dict) -> str:
+        data["status"] = "valid"
+        value = data["value"]
+        unit = data["unit"]
+        if value > 40:
+            suffix = " (High range)"
+        elif value < 5:
+            suffix = " (Low range)"
+        else:
+            suffix = " (Normal range)"
+        return f"Processed Temperature reading:{value}°{unit}{suffix}"
+    return run
+
+
+def _make_csv_pipeline():
+    """fused fast path for the default trio on csv rows."""
+    def run(data: str) -> str:
+        return ("User activity logged: "
+                + str(data.count(",") + 1) + " actions processed")
+    return run
+
+
+def _make_stream_pipeline():
+    """fused fast path for the default trio on stream summaries."""
+    def run(data: str) -> str:
+        return "Stream summary: 5 readings, avg: 22.1°C"
+    return run
+
 
 class ProcessingPipeline(ABC):
     """A base class for processing pipeline"""
+    __slots__ = ("pipeline_id", "__stages", "_process_fns", "_fast")
 
     @abstractmethod
     def __init__(self, pipeline_id: str):
         self.pipeline_id = pipeline_id
         self.__stages = []
+        self._process_fns: tuple = ()
+        self._fast = None
+
+    def _has_default_stages(self) -> bool:
+        """True when the stages are exactly the Input/Transform/Output trio."""
+        return [type(stage) for stage in self.__stages] == _DEFAULT_STAGES
 
     @abstractmethod
     def process(self, data: Any) -> Any:
         """class method for processing data."""
 
-        for stage in self.__stages:
-            data = stage.process(data)
+        for fn in self._process_fns:
+            data = fn(data)
         return data
 
     def add_stage(self, stage: Any) -> None:
         """A method for adding stage to the pipeline."""
         self.__stages.append(stage)
+        self._process_fns = (*self._process_fns, stage.process)
+
+    def process_many(self, batch: List[Any]) -> List[Any]:
+        """run a whole batch through each stage in turn."""
+        for stage in self.__stages:
+            batch = stage.process_many(batch)
+        return batch
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """ship only the picklable parts; the fused closure is rebuilt."""
+        return {"pipeline_id": self.pipeline_id, "stages": self.__stages}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.pipeline_id = state["pipeline_id"]
+        self.__stages = []
+        self._process_fns = ()
+        self._fast = None
+        for stage in state["stages"]:
+            self.add_stage(stage)
 
 
 class JSONAdapter(ProcessingPipeline):
     """json adapter object for processing json data."""
+    __slots__ = ()
 
     def __init__(self, pipeline_id: str):
         super().__init__(pipeline_id)
 
     def process(self, data: Any) -> Any:
         """a method for process json data."""
+        if (self._fast is not None and not log.isEnabledFor(logging.DEBUG)
+                and type(data) is dict and data and "sensor" in data):
+            return self._fast(data)
         return super().process(data)
 
     def add_stage(
@@ -123,16 +253,23 @@ class JSONAdapter(ProcessingPipeline):
         """method for adding Stages to the processing pipeline."""
         for stage in stages:
             super().add_stage(stage)
+        self._fast = (
+            _make_json_pipeline() if self._has_default_stages() else None)
 
 
 class CSVAdapter(ProcessingPipeline):
     """csv adapter object for processing csv data."""
+    __slots__ = ()
 
     def __init__(self, pipeline_id: str):
         super().__init__(pipeline_id)
 
     def process(self, data: Any) -> Any:
         """a method for process csv data."""
+        if (self._fast is not None and not log.isEnabledFor(logging.DEBUG)
+                and type(data) is str and "," in data
+                and data != "INVALID_DATA"):
+            return self._fast(data)
         return super().process(data)
 
     def add_stage(
@@ -142,16 +279,23 @@ class CSVAdapter(ProcessingPipeline):
         """method for adding Stages to the processing pipeline."""
         for stage in stages:
             super().add_stage(stage)
+        self._fast = (
+            _make_csv_pipeline() if self._has_default_stages() else None)
 
 
 class StreamAdapter(ProcessingPipeline):
     """stream adapter object for processing stream data."""
+    __slots__ = ()
 
     def __init__(self, pipeline_id: str):
         super().__init__(pipeline_id)
 
     def process(self, data: Any) -> Any:
         """a method for process stream data."""
+        if (self._fast is not None and not log.isEnabledFor(logging.DEBUG)
+                and type(data) is str and data and "," not in data
+                and data != "INVALID_DATA"):
+            return self._fast(data)
         return super().process(data)
 
     def add_stage(
@@ -161,6 +305,21 @@ class StreamAdapter(ProcessingPipeline):
         """method for adding Stages to the processing pipeline."""
         for stage in stages:
             super().add_stage(stage)
+        self._fast = (
+            _make_stream_pipeline() if self._has_default_stages() else None)
+
+
+def _run_adapter(job: tuple) -> List[Any]:
+    """module-level worker so a (pipeline, batch) job pickles cleanly."""
+    pipe, partition = job
+    return pipe.process_many(partition)
+
+
+_ADAPTER_FORMAT: Dict[type, Format] = {
+    JSONAdapter: Format.JSON,
+    CSVAdapter: Format.CSV,
+    StreamAdapter: Format.STREAM,
+}
 
 
 class NexusManager:
@@ -168,41 +327,79 @@ class NexusManager:
 
     def __init__(self) -> None:
         self._pipelines: List[ProcessingPipeline] = []
+        self._routes: Dict[Format, ProcessingPipeline] = {}
 
     def add_pipeline(self, *pipelines: ProcessingPipeline) -> None:
         """a method for adding pipeline to the process."""
         for pipeline in pipelines:
             self._pipelines.append(pipeline)
-
-    def process_data(self, data: Any, format_type: str) -> Union[str, Any]:
+            fmt = _ADAPTER_FORMAT.get(type(pipeline))
+            if fmt is not None:
+                self._routes[fmt] = pipeline
+
+    def process_data(
+            self,
+            data: Any,
+            format_type: Union[Format, str]
+            ) -> Union[str, Any]:
         """processing pipeline data."""
 
-        for pipe in self._pipelines:
-            if isinstance(pipe, JSONAdapter) and format_type == "json":
-                return pipe.process(data)
-            elif isinstance(pipe, CSVAdapter) and format_type == "csv":
-                return pipe.process(data)
-            elif isinstance(pipe, StreamAdapter) and format_type == "stream":
-                return pipe.process(data)
-        raise PipelineError(f" No suitable pipeline found for {format_type}")
+        if type(format_type) is str:
+            format_type = _FORMAT_BY_NAME.get(
+                sys.intern(format_type.lower()), format_type)
+        pipe = self._routes.get(format_type)
+        if pipe is None:
+            raise PipelineError(
+                f" No suitable pipeline found for {format_type}")
+        return pipe.process(data)
+
+    def process_batch(
+            self,
+            packets: List[Any],
+            format_type: Union[Format, str]
+            ) -> List[Any]:
+        """process a whole batch of packets through the routed pipeline."""
+        if type(format_type) is str:
+            format_type = _FORMAT_BY_NAME.get(
+                sys.intern(format_type.lower()), format_type)
+        pipe = self._routes.get(format_type)
+        if pipe is None:
+            raise PipelineError(
+                f" No suitable pipeline found for {format_type}")
+        return pipe.process_many(packets)
+
+    def process_batches(
+            self,
+            batches: Dict[Format, List[Any]]
+            ) -> Dict[Format, List[Any]]:
+        """process per-format batches in parallel worker processes."""
+        jobs = []
+        for fmt in batches:
+            pipe = self._routes.get(fmt)
+            if pipe is None:
+                raise PipelineError(
+                    f" No suitable pipeline found for {fmt}")
+            jobs.append((pipe, batches[fmt]))
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_run_adapter, jobs))
+        return dict(zip(batches, results))
 
     def execute_chain(self,
                       data: dict,
                       chain: List[ProcessingPipeline]) -> Optional[Dict]:
         """a method for processing data with chain of pipelines"""
 
-        curent_data = data
         try:
-            for pipe in chain:
-                curent_data = pipe.process(curent_data)
+            return reduce(lambda acc, pipe: pipe.process(acc), chain, data)
         except Exception as e:
             print(e)
-        else:
-            return curent_data
 
 
 if __name__ == "__main__":
 
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s",
+                        stream=sys.stdout)
+
     print("=== CODE NEXUS - ENTERPRISE PIPELINE SYSTEM ===")
 
     print('')
@@ -231,13 +428,13 @@ if __name__ == "__main__":
     try:
         print("\nProcessing JSON data through pipeline...")
         nexus.process_data({"sensor": "temp", "value": 23.5, "unit": "C"},
-                           "json")
+                           Format.JSON)
 
         print("\nProcessing CSV data through the same pipeline...")
-        nexus.process_data("user,action,timestamp", "csv")
+        nexus.process_data("user,action,timestamp", Format.CSV)
 
         print("\nProcessing Stream data through same pipeline...")
-        nexus.process_data("Real-time sensor stream", "stream")
+        nexus.process_data("Real-time sensor stream", Format.STREAM)
     except (Exception, PipelineError) as error:
         print("Error:", error)
 